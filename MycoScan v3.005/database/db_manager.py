@@ -1,17 +1,36 @@
 # database/db_manager.py
-import os, sqlite3, cv2, numpy as np
+import os, sqlite3, threading, cv2, numpy as np
 from datetime import datetime
+from typing import Iterable
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "mycoscan.db")
+JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 80, cv2.IMWRITE_JPEG_OPTIMIZE, 1]
 
 class DatabaseManager:
     def __init__(self, path: str = DB_PATH):
         self.path = path
+        self._local = threading.local()
         self._init_db()
 
     # ---------- internal ----------
     def _connect(self):
-        return sqlite3.connect(self.path)
+        """Return this thread's cached connection, opening it on first use."""
+        con = getattr(self._local, "con", None)
+        if con is None:
+            con = sqlite3.connect(self.path)
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+            con.execute("PRAGMA temp_store=MEMORY")
+            con.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+            self._local.con = con
+        return con
+
+    def close(self):
+        """Close the calling thread's connection, if one is open."""
+        con = getattr(self._local, "con", None)
+        if con is not None:
+            con.close()
+            self._local.con = None
 
     def _init_db(self):
         with self._connect() as con:
@@ -26,12 +45,11 @@ class DatabaseManager:
                     image BLOB
                 );
             """)
-            con.commit()
 
     # ---------- image helpers ----------
     @staticmethod
     def _encode_image(img_bgr) -> bytes:
-        ok, buf = cv2.imencode(".jpg", img_bgr)
+        ok, buf = cv2.imencode(".jpg", img_bgr, JPEG_PARAMS)
         if not ok:
             raise RuntimeError("Failed to encode image")
         return buf.tobytes()
@@ -52,13 +70,31 @@ class DatabaseManager:
                 (patient, severity, recommendation, datetime.now().strftime("%Y-%m-%d"),
                  sqlite3.Binary(self._encode_image(img_bgr))),
             )
-            con.commit()
 
-    def get_all_scans(self):
-        """Return rows as list of tuples: (id, patient, severity, recommendation, date)."""
+    def add_scans_bulk(self, scans: Iterable[tuple[str, str, str, np.ndarray]]):
+        """Insert many scans in one transaction. `scans` is an iterable of
+        (patient, severity, recommendation, img_bgr) tuples."""
+        date = datetime.now().strftime("%Y-%m-%d")
+        rows = [
+            (patient, severity, reco, date, sqlite3.Binary(self._encode_image(img_bgr)))
+            for patient, severity, reco, img_bgr in scans
+        ]
+        with self._connect() as con:
+            cur = con.cursor()
+            cur.executemany(
+                "INSERT INTO scans (patient, severity, recommendation, date, image) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def get_all_scans(self, limit: int | None = None, offset: int = 0):
+        """Return rows as list of tuples: (id, patient, severity, recommendation, date).
+        Pass `limit`/`offset` to fetch one page; the image column is never read here."""
         with self._connect() as con:
             cur = con.cursor()
-            cur.execute("SELECT id, patient, severity, recommendation, date FROM scans ORDER BY id DESC")
+            cur.execute(
+                "SELECT id, patient, severity, recommendation, date FROM scans ORDER BY id DESC LIMIT ? OFFSET ?",
+                (-1 if limit is None else limit, offset),
+            )
             return cur.fetchall()
 
     def get_scan_by_id(self, scan_id: int):
@@ -81,16 +117,13 @@ class DatabaseManager:
         with self._connect() as con:
             cur = con.cursor()
             cur.execute("UPDATE scans SET patient=? WHERE id=?", (new_name, scan_id))
-            con.commit()
 
     def delete_scan(self, scan_id: int):
         with self._connect() as con:
             cur = con.cursor()
             cur.execute("DELETE FROM scans WHERE id=?", (scan_id,))
-            con.commit()
 
     def delete_all(self):
         with self._connect() as con:
             cur = con.cursor()
             cur.execute("DELETE FROM scans")
-            con.commit()